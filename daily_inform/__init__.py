@@ -0,0 +1,3 @@
+# Daily Market & Robotics News Agent
+# 무거운 의존성(yfinance, feedparser 등)은 각 하위 모듈의 실행 경로 안에서만 import 함.
+__version__ = "0.1.0"
@@ -0,0 +1,3 @@
+from daily_inform.cli import main
+
+main()
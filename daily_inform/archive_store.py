@@ -0,0 +1,99 @@
+import gzip
+import json
+import os
+
+# ==========================================
+# 뉴스 아카이브 (Hot / Cold 계층 저장)
+# ==========================================
+# - Hot: news_archive.json (최근 HOT_ITEMS 개, 중복 체크와 렌더링에 사용)
+# - Cold: archive/YYYY-MM.json.gz (월별 압축 세그먼트) + archive/index.json
+# 매 실행마다 hot 에서 밀려난 항목이 속한 월 세그먼트만 다시 쓰므로 실행 비용은 일정함.
+ARCHIVE_FILE = 'news_archive.json'
+COLD_DIR = 'archive'
+COLD_INDEX_FILE = 'index.json'
+HOT_ITEMS = 1000
+
+
+def load_archive(path=ARCHIVE_FILE):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+
+def segment_name(month):
+    return f"{month}.json.gz"
+
+
+def load_index(cold_dir=COLD_DIR):
+    path = os.path.join(cold_dir, COLD_INDEX_FILE)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"segments": []}
+
+
+def load_segment(month, cold_dir=COLD_DIR):
+    path = os.path.join(cold_dir, segment_name(month))
+    if not os.path.exists(path): return []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_segment(month, items, cold_dir):
+    path = os.path.join(cold_dir, segment_name(month))
+    tmp = path + '.tmp'
+    # mtime=0 → 내용이 같으면 파일도 바이트 단위로 동일 (불필요한 git 변경 방지)
+    with open(tmp, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as gz:
+        gz.write(json.dumps(items, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    os.replace(tmp, path)
+
+
+def roll_to_cold(items, cold_dir=COLD_DIR):
+    # 월별로 묶어서 기존 세그먼트와 병합 (link 기준 중복 제거)
+    if not items: return
+    os.makedirs(cold_dir, exist_ok=True)
+    by_month = {}
+    for item in items:
+        by_month.setdefault(item['date'][:7], []).append(item)
+
+    index = load_index(cold_dir)
+    segments = {seg['month']: seg for seg in index['segments']}
+    for month, new_items in by_month.items():
+        merged = {item['link']: item for item in load_segment(month, cold_dir)}
+        for item in new_items:
+            merged.setdefault(item['link'], item)
+        seg_items = sorted(merged.values(), key=lambda x: x['date'], reverse=True)
+        _write_segment(month, seg_items, cold_dir)
+        segments[month] = {
+            "month": month,
+            "file": segment_name(month),
+            "count": len(seg_items),
+            "newest": seg_items[0]['date'],
+            "oldest": seg_items[-1]['date'],
+        }
+
+    index['segments'] = sorted(segments.values(), key=lambda s: s['month'], reverse=True)
+    with open(os.path.join(cold_dir, COLD_INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def save_archive(data, path=ARCHIVE_FILE, hot_items=HOT_ITEMS, cold_dir=COLD_DIR):
+    # data 는 제자리에서 최신순 정렬 후 hot 범위로 잘림
+    data.sort(key=lambda x: x['date'], reverse=True)
+    if len(data) > hot_items:
+        roll_to_cold(data[hot_items:], cold_dir)
+        del data[hot_items:]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def find_item(link, hot=None, month=None, cold_dir=COLD_DIR):
+    # hot → (지정된 월 또는 최신 월부터) cold 세그먼트 순으로 검색
+    for item in hot if hot is not None else load_archive():
+        if item.get('link') == link: return item
+    months = [month] if month else [seg['month'] for seg in load_index(cold_dir)['segments']]
+    for m in months:
+        for item in load_segment(m, cold_dir):
+            if item.get('link') == link: return item
+    return None
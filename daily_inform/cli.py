@@ -0,0 +1,78 @@
+import argparse
+
+# ==========================================
+# daily-inform 명령행 (market / news / render / legacy / publish / run)
+# ==========================================
+# 각 하위 명령은 필요한 모듈만 실행 시점에 import → market/render 는 feedparser·LLM 코드를 읽지 않음
+
+
+def cmd_market(args):
+    from daily_inform import pipeline
+    if pipeline.update_market(refresh_all=args.all):
+        print("✅ 완료! 주식 정보 업데이트됨.")
+
+
+def cmd_news(args):
+    from daily_inform import pipeline
+    pipeline.update_news()
+
+
+def cmd_render(args):
+    from daily_inform import pipeline
+    pipeline.render_all()
+
+
+def cmd_legacy(args):
+    from daily_inform import legacy
+    legacy.run()
+
+
+def _publish(args):
+    from daily_inform import publish
+    publish.publish(message=args.message or publish.COMMIT_MESSAGE, window=args.window,
+                    pages_branch=args.pages_branch, remote=args.remote)
+
+
+def cmd_publish(args):
+    _publish(args)
+
+
+def cmd_run(args):
+    # 로컬 PC 정기 실행: pull → 뉴스/시장 수집 → 렌더링 → 업로드
+    from daily_inform import pipeline, publish
+    from daily_inform.util import log
+    log("🚀 로컬 업데이트 시작")
+    publish.git_pull()
+    pipeline.update_news()
+    _publish(args)
+
+
+def add_publish_args(parser):
+    parser.add_argument("--message", help="커밋 메시지 (기본: Local AI Update)")
+    parser.add_argument("--window", type=int, default=0,
+                        help="이 시간(초) 안에 만든 같은 메시지의 배포 커밋이 아직 push 전이면 amend 로 합침")
+    parser.add_argument("--pages-branch", help="웹 결과물을 히스토리 없이 force push 할 브랜치 (예: gh-pages)")
+    parser.add_argument("--remote", default="origin")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="daily-inform", description="Daily Market & Robotics News Agent")
+    sub = parser.add_subparsers(dest="command", required=True)
+    market_parser = sub.add_parser("market", help="장중/막 마감된 시장 데이터만 갱신하고 index.html 렌더링")
+    market_parser.add_argument("--all", action="store_true", help="거래 시간과 관계없이 모든 심볼 갱신")
+    market_parser.set_defaults(func=cmd_market)
+    sub.add_parser("news", help="뉴스 수집/번역 + 시장 데이터 갱신 후 전체 렌더링").set_defaults(func=cmd_news)
+    sub.add_parser("render", help="저장된 데이터로 index.html / news.html 다시 생성").set_defaults(func=cmd_render)
+    sub.add_parser("legacy", help="Ollama 대신 구글 번역기로 수집/번역 후 렌더링 (기존 update.py)").set_defaults(func=cmd_legacy)
+    publish_parser = sub.add_parser("publish", help="변경된 결과물만 git commit / push")
+    add_publish_args(publish_parser)
+    publish_parser.set_defaults(func=cmd_publish)
+    run_parser = sub.add_parser("run", help="pull → news → publish (로컬 정기 실행용)")
+    add_publish_args(run_parser)
+    run_parser.set_defaults(func=cmd_run)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
@@ -0,0 +1,121 @@
+import datetime
+import time
+
+from daily_inform import archive_store, market, pipeline, render, trends
+from daily_inform.news import clean_html, entry_pub_date, item_keywords
+from daily_inform.util import log
+
+# ==========================================
+# 구글 번역기 버전 (GPU/Ollama 없이 실행, 기존 update.py)
+# ==========================================
+# deep_translator / feedparser / yfinance 는 실행할 때만 import
+MAX_NEW_ITEMS = 20
+
+# [경제 뉴스] - 아침 브리핑용
+RSS_ECONOMY = [{"url": "https://news.google.com/rss/search?q=stock+market+economy+korea+usa&hl=ko&gl=KR&ceid=KR:ko", "title": "📈 국내외 증시", "cat": "economy"}]
+
+# [휴머노이드/로봇 일반 뉴스]
+RSS_HUMANOID = [
+    {"url": "https://news.google.com/rss/search?q=humanoid+robot+(startup+OR+unveiled+OR+prototype+OR+new+model)+-vacuum&hl=ko&gl=KR&ceid=KR:ko", "title": "Google News", "cat": "humanoid"},
+    {"url": "https://techxplore.com/rss-feed/robotics-news/", "title": "Tech Xplore", "cat": "humanoid"},
+    {"url": "https://spectrum.ieee.org/feeds/topic/robotics.rss", "title": "IEEE Spectrum", "cat": "humanoid"},
+    {"url": "https://www.therobotreport.com/feed/", "title": "The Robot Report", "cat": "humanoid"},
+    {"url": "http://www.irobotnews.com/rss/all.xml", "title": "로봇신문", "cat": "humanoid"},
+    {"url": "https://humanoidroboticstechnology.com/feed/", "title": "Humanoid Tech Blog", "cat": "humanoid"}
+]
+
+# [로봇 핸드/그리퍼 뉴스]
+RSS_HAND = [
+    {"url": "https://news.google.com/rss/search?q=robot+hand+gripper+dexterous+manipulation+tactile+sensor+-vacuum&hl=ko&gl=KR&ceid=KR:ko", "title": "Google News", "cat": "hand"}
+]
+
+
+def translate_text(text):
+    if not text: return ""
+    from deep_translator import GoogleTranslator
+    try:
+        # 영어를 한국어로 번역 (고유명사는 구글 번역기 로직을 따름)
+        return GoogleTranslator(source='auto', target='ko').translate(text)
+    except Exception as e:
+        log(f"❌ Translation Error: {e}")
+        return text # 에러나면 원문 그대로 리턴
+
+
+def collect_economy():
+    import feedparser
+    economy_news = []
+    for src in RSS_ECONOMY:
+        try:
+            feed = feedparser.parse(src["url"], agent="Mozilla/5.0")
+            for entry in feed.entries[:4]:
+                # 렌더링은 원본 entry 대신 제목/링크만 담은 dict 로
+                economy_news.append({"title": translate_text(entry.title), "link": entry.link})
+                time.sleep(0.5) # 짧은 대기
+        except: pass
+    return economy_news
+
+
+def collect_robotics(archive, trend_counter=None):
+    import feedparser
+    existing_links = set(item['link'] for item in archive)
+    today = datetime.datetime.now()
+    new_items_count = 0
+    for src in RSS_HUMANOID + RSS_HAND:
+        try:
+            feed = feedparser.parse(src["url"], agent="Mozilla/5.0")
+            for entry in feed.entries:
+                link = entry.link
+                if link in existing_links: continue
+                pub_dt = entry_pub_date(entry, today)
+                if (today - pub_dt).days > 7: continue
+
+                log(f"Processing: {entry.title}...")
+                raw_snippet = clean_html(entry.get('description', entry.get('summary', '')))
+                title_ko = translate_text(entry.title)
+                # 내용은 너무 길면 500자만 잘라서 번역
+                summary_ko = translate_text(raw_snippet[:500])
+                time.sleep(1)
+
+                news_item = {
+                    "title": title_ko,
+                    "original_title": entry.title,
+                    "link": link,
+                    "date": pub_dt.strftime("%Y-%m-%d %H:%M"),
+                    "source": src['title'],
+                    "category": src['cat'],
+                    "summary": summary_ko
+                }
+                archive.append(news_item)
+                if trend_counter is not None:
+                    trend_counter.add(news_item, item_keywords(news_item))
+                existing_links.add(link)
+                new_items_count += 1
+                if new_items_count >= MAX_NEW_ITEMS:
+                    log(f"🛑 {MAX_NEW_ITEMS}개 처리 완료. 종료합니다.")
+                    return new_items_count
+        except Exception as e:
+            log(f"RSS Error: {e}")
+    return new_items_count
+
+
+def run():
+    log("1. 시장 데이터 수집...")
+    metrics = {key: market.get_metric_data(ticker, color) for key, ticker, color in market.MARKET_METRICS}
+    korea_html = render.korea_table_html([market.get_korea_row(*t) for t in market.KOREA_TICKERS])
+
+    log("2. 뉴스 데이터 수집 및 번역 (Deep Translator)...")
+    archive = archive_store.load_archive()
+    trend_counter = pipeline.load_trends(archive)
+    economy_news = collect_economy()
+    new_items_count = collect_robotics(archive, trend_counter)
+    archive_store.save_archive(archive)
+    trends.save_trends(trend_counter)
+    log(f"New items: {new_items_count}")
+
+    log("3. HTML 생성...")
+    now_str = render.kst_now_str()
+    latest_humanoid = [x for x in archive if x['category'] == 'humanoid']
+    latest_hand = [x for x in archive if x['category'] == 'hand']
+    render.render_index(metrics, korea_html, economy_news, latest_humanoid, latest_hand, now_str=now_str)
+    render.render_news_page(latest_humanoid, latest_hand, now_str=now_str, trends=trend_counter)
+    log("완료!")
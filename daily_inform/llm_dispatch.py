@@ -0,0 +1,96 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# ==========================================
+# 여러 Ollama 서버로 LLM 요청 분산 (Load-balanced Dispatch)
+# ==========================================
+DEFAULT_ENDPOINT = "http://localhost:11434"
+FAILURE_COOLDOWN = 60      # 오류난 서버는 60초간 제외
+MISSING_MODEL_COOLDOWN = 600  # 모델이 없는 서버(404)는 해당 모델만 10분간 제외
+LATENCY_ALPHA = 0.3        # 응답시간 이동평균 가중치
+
+
+class DispatchError(Exception):
+    pass
+
+
+class Endpoint:
+    def __init__(self, host):
+        self.host = host.rstrip('/')
+        self.in_flight = 0
+        self.latency = 0.0
+        self.down_until = 0.0
+        self.missing_models = {}
+
+    def has_model(self, model, now):
+        return self.missing_models.get(model, 0) <= now
+
+    def available(self, model, now):
+        return self.down_until <= now and self.has_model(model, now)
+
+
+class OllamaDispatcher:
+    def __init__(self, hosts=None, timeout=300, log=print):
+        self.endpoints = [Endpoint(h) for h in (hosts or [DEFAULT_ENDPOINT])]
+        self.timeout = timeout
+        self.log = log
+        self._lock = threading.Lock()
+
+    def _ranked(self, model):
+        # 진행 중인 요청 수 → 최근 응답시간 순으로 정렬
+        now = time.monotonic()
+        with self._lock:
+            # 모델이 없는(404) 서버는 요청하지 않음 → 모든 서버에 없으면 바로 DispatchError (상위 모델로 넘어감)
+            candidates = [ep for ep in self.endpoints if ep.has_model(model, now)]
+            healthy = [ep for ep in candidates if ep.available(model, now)]
+            if candidates and not healthy:
+                # 일시 오류로 모두 제외 중이면 가장 먼저 풀리는 서버라도 시도 (마지막/유일한 서버를 완전히 막지 않음)
+                return [min(candidates, key=lambda ep: (ep.down_until, ep.in_flight))]
+            return sorted(healthy, key=lambda ep: (ep.in_flight, ep.latency))
+
+    def _post(self, ep, model, messages):
+        body = json.dumps({"model": model, "messages": messages, "stream": False}).encode('utf-8')
+        req = urllib.request.Request(f"{ep.host}/api/chat", data=body,
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return json.loads(resp.read().decode('utf-8'))
+
+    def chat(self, model, messages):
+        # ollama.chat 와 같은 형태 ({'message': {'content': ...}}) 로 반환
+        last_error = None
+        for ep in self._ranked(model):
+            with self._lock:
+                ep.in_flight += 1
+            started = time.monotonic()
+            try:
+                result = self._post(ep, model, messages)
+            except urllib.error.HTTPError as e:
+                last_error = e
+                with self._lock:
+                    if e.code == 404:
+                        ep.missing_models[model] = time.monotonic() + MISSING_MODEL_COOLDOWN
+                    else:
+                        ep.down_until = time.monotonic() + FAILURE_COOLDOWN
+                self.log(f"⚠️ {ep.host} failed for {model} (HTTP {e.code}), failing over...")
+                continue
+            except Exception as e:
+                last_error = e
+                with self._lock:
+                    ep.down_until = time.monotonic() + FAILURE_COOLDOWN
+                self.log(f"⚠️ {ep.host} unreachable ({e}), failing over...")
+                continue
+            finally:
+                with self._lock:
+                    ep.in_flight -= 1
+
+            elapsed = time.monotonic() - started
+            with self._lock:
+                ep.latency = elapsed if not ep.latency else (1 - LATENCY_ALPHA) * ep.latency + LATENCY_ALPHA * elapsed
+            return result
+
+        if last_error is None:
+            raise DispatchError(f"model '{model}' not found on any Ollama endpoint")
+        raise DispatchError(f"all Ollama endpoints failed for model '{model}': {last_error}")
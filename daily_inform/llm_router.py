@@ -0,0 +1,100 @@
+import os
+import re
+
+# ==========================================
+# 모델 라우팅 (Fast → Strong Cascade)
+# ==========================================
+# 짧은 헤드라인은 작은 모델로 먼저 처리하고, 검증 실패 시 또는 논문일 때만 큰 모델 사용
+DEFAULT_ROUTING = {
+    "fast_model": "gemma3:4b",
+    "strong_model": "gemma4:latest",
+    "strong_categories": ["paper"],
+    "strong_attempts": 2,
+    "min_title_len": 2,
+    "max_title_len": 200,
+    "min_summary_len": 10,
+    "max_summary_len": 800,
+    "endpoints": ["http://localhost:11434"],
+    "snippet_tokens": 400,
+}
+
+KOREAN_RE = re.compile(r'[가-힣]')
+
+
+def load_routing(feeds_config):
+    routing = dict(DEFAULT_ROUTING)
+    routing.update((feeds_config or {}).get("routing", {}))
+    # OLLAMA_HOSTS="http://gpu1:11434,http://gpu2:11434" 로 서버 목록 덮어쓰기
+    hosts = os.environ.get("OLLAMA_HOSTS")
+    if hosts:
+        routing["endpoints"] = [h.strip() for h in hosts.split(",") if h.strip()]
+    return routing
+
+
+def pick_models(routing, src=None):
+    # feeds.json 의 피드별 "model" 값: "fast" | "strong" | 직접 모델 이름
+    src = src or {}
+    fast, strong = routing["fast_model"], routing["strong_model"]
+    choice = src.get("model")
+    if choice == "strong" or (choice is None and src.get("cat") in routing["strong_categories"]):
+        return [strong]
+    if choice and choice not in ("fast", "strong"):
+        return [choice]
+    if not fast or fast == strong:
+        return [strong]
+    return [fast, strong]
+
+
+def _strip(text):
+    return text.strip().strip('*').strip('#').strip()
+
+
+def parse_llm_output(result_text):
+    # "제목 ||| 요약" 형식 우선, 없으면 첫 줄 = 제목 / 나머지 = 요약
+    result_text = result_text.strip()
+    if "|||" in result_text:
+        parts = result_text.split("|||")
+        return _strip(parts[0]), _strip(parts[1])
+    lines = [l for l in result_text.split('\n') if l.strip()]
+    if len(lines) >= 2:
+        return _strip(lines[0]), _strip(" ".join(lines[1:]))
+    return None
+
+
+def validate_output(parsed, routing):
+    if not parsed: return "format"
+    t_ko, s_ko = parsed
+    if not KOREAN_RE.search(t_ko) or not KOREAN_RE.search(s_ko): return "no-korean"
+    if not routing["min_title_len"] <= len(t_ko) <= routing["max_title_len"]: return "title-length"
+    if not routing["min_summary_len"] <= len(s_ko) <= routing["max_summary_len"]: return "summary-length"
+    return None
+
+
+def run_cascade(chat_fn, models, messages, routing, log=print):
+    # 성공 시 (제목, 요약), 모든 모델이 실패하면 None
+    fallback = None
+    for i, model in enumerate(models):
+        is_last = i == len(models) - 1
+        attempts = routing["strong_attempts"] if is_last else 1
+        for attempt in range(attempts):
+            try:
+                response = chat_fn(model=model, messages=messages)
+                result_text = response['message']['content'].strip()
+            except Exception as e:
+                log(f"❌ LLM Error ({model}): {e}")
+                break
+
+            parsed = parse_llm_output(result_text)
+            reason = validate_output(parsed, routing)
+            if reason is None:
+                return parsed
+            if parsed and KOREAN_RE.search(parsed[0]):
+                fallback = parsed
+            elif KOREAN_RE.search(result_text):
+                fallback = (_strip(result_text), _strip(result_text))
+
+            if is_last:
+                log(f"⚠️ Warning: {model} output rejected ({reason}). Retrying... (Attempt {attempt+1})")
+            else:
+                log(f"↗️ {model} output rejected ({reason}), escalating to {models[i+1]}")
+    return fallback
@@ -0,0 +1,138 @@
+import asyncio
+import datetime
+import json
+import os
+import urllib.parse
+
+from daily_inform import market_calendar, render
+from daily_inform.util import log
+
+# ==========================================
+# 시장 데이터 (yfinance 는 조회할 때만 import)
+# ==========================================
+DASHBOARD_FILE = 'dashboard_state.json'
+
+MARKET_METRICS = [
+    ("KOSPI", "^KS11", "red"), ("KOSDAQ", "^KQ11", "red"),
+    ("SP500", "^GSPC", "red"), ("NASDAQ", "^IXIC", "red"),
+    ("GOLD", "GC=F", "gold"), ("SILVER", "SI=F", "silver"),
+    ("USDKRW", "KRW=X", "green"),
+]
+
+KOREA_TICKERS = [
+    ('005930.KS', '삼성전자', '005930'), ('000660.KS', 'SK하이닉스', '000660'),
+    ('373220.KS', 'LG에너지솔루션', '373220'), ('207940.KS', '삼성바이오로직스', '207940'),
+    ('005380.KS', '현대차', '005380'), ('005490.KS', 'POSCO홀딩스', '005490'),
+    ('000270.KS', '기아', '000270'), ('035420.KS', 'NAVER', '035420')
+]
+
+
+def make_sparkline_url(data_list, color):
+    if not data_list or len(data_list) < 2: return ""
+    subset = data_list[-30:]
+    data_str = ",".join([f"{x:.2f}" for x in subset])
+    chart_config = f"{{type:'sparkline',data:{{datasets:[{{data:[{data_str}],borderColor:'{color}',borderWidth:2,fill:false,pointRadius:0}}]}}}}"
+    return "https://quickchart.io/chart?c=" + urllib.parse.quote(chart_config)
+
+
+def get_metric_data(ticker, color, intraday=False):
+    import yfinance as yf
+    try:
+        stock = yf.Ticker(ticker)
+        hist_daily = stock.history(period="1mo")
+        hist = hist_daily
+        if intraday:
+            # 1시간 간격 업데이트이므로 최근 데이터 가져오기 (장 마감 등으로 없으면 일별 데이터)
+            hist_hourly = stock.history(period="5d", interval="1h")
+            if not hist_hourly.empty: hist = hist_hourly
+        if hist.empty: return "N/A", "0.00%", ""
+        current = hist['Close'].iloc[-1]
+        prev = hist['Close'].iloc[-2]
+        change = current - prev
+        change_pct = (change / prev) * 100
+        sign = "+" if change >= 0 else ""
+        css_class = "text-red" if change >= 0 else "text-blue"
+        val_str = f"{current:,.2f}"
+        if ticker == "KRW=X": val_str += " 원"
+        change_str = f"<span class='{css_class}'>{sign}{change:.2f} ({sign}{change_pct:.2f}%)</span>"
+        # 차트용 데이터는 일별 종가 사용 (깔끔하게 보이기 위해)
+        chart_url = make_sparkline_url(hist_daily['Close'].tolist(), color)
+        return val_str, change_str, chart_url
+    except: return "Error", "-", ""
+
+
+def get_korea_row(code, name, naver_code):
+    import yfinance as yf
+    try:
+        stock = yf.Ticker(code)
+        hist = stock.history(period="1mo")
+        if hist.empty: return ""
+        curr = hist['Close'].iloc[-1]
+        prev = hist['Close'].iloc[-2]
+        pct = ((curr - prev) / prev) * 100
+        line_color = "red" if pct > 0 else "blue" if pct < 0 else "gray"
+        chart = make_sparkline_url(hist['Close'].tolist(), line_color)
+        return render.korea_row_html(code, name, naver_code, curr, pct, chart)
+    except: return ""
+
+
+def _fetched_at(state, symbol):
+    value = state.get("fetched", {}).get(symbol)
+    return datetime.datetime.fromisoformat(value) if value else None
+
+
+async def refresh_market(state, intraday=False, only_needed=False, now=None):
+    # only_needed: 장이 열려 있거나 막 마감된 심볼만 조회하고 나머지는 스냅샷 값을 재사용
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    metrics_todo = [(key, ticker, color) for key, ticker, color in MARKET_METRICS
+                    if not only_needed or market_calendar.needs_refresh(ticker, now, _fetched_at(state, ticker))]
+    korea_todo = [t for t in KOREA_TICKERS
+                  if not only_needed or market_calendar.needs_refresh(t[0], now, _fetched_at(state, t[0]))]
+    if not metrics_todo and not korea_todo:
+        log("💤 모든 시장이 휴장 중 → 마지막 스냅샷 유지")
+        return []
+
+    # 필요한 심볼을 스레드에서 동시에 조회
+    log(f"📈 시장 데이터 수집... ({len(metrics_todo) + len(korea_todo)}개 심볼)")
+    metric_tasks = [asyncio.to_thread(get_metric_data, ticker, color, intraday) for _, ticker, color in metrics_todo]
+    row_tasks = [asyncio.to_thread(get_korea_row, *t) for t in korea_todo]
+    results = await asyncio.gather(*metric_tasks, *row_tasks)
+
+    metrics = state.setdefault("metrics", {})
+    rows = state.setdefault("korea_rows", {})
+    fetched = state.setdefault("fetched", {})
+    refreshed = []
+    for (key, ticker, _), result in zip(metrics_todo, results[:len(metrics_todo)]):
+        # 조회 실패 시 이전 값 유지, 조회 시각은 기록하지 않아 다음 실행에서 다시 시도
+        if result[0] in ("Error", "N/A"):
+            metrics.setdefault(key, list(result))
+            continue
+        metrics[key] = list(result)
+        fetched[ticker] = now.isoformat()
+        refreshed.append(ticker)
+    for (code, _, _), row in zip(korea_todo, results[len(metrics_todo):]):
+        if not row:
+            rows.setdefault(code, "")
+            continue
+        rows[code] = row
+        fetched[code] = now.isoformat()
+        refreshed.append(code)
+    state["korea_html"] = render.korea_table_html([rows.get(code, "") for code, _, _ in KOREA_TICKERS])
+    log(f"📈 시장 데이터 수집 완료 ({len(refreshed)}개 갱신)")
+    return refreshed
+
+
+# ==========================================
+# 대시보드 스냅샷 (마지막 시장 데이터 + 경제 뉴스)
+# ==========================================
+# render 만 하는 실행이나 시장 데이터만 갱신하는 실행에서 나머지 입력을 재사용
+def load_dashboard(path=DASHBOARD_FILE):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {"metrics": {}, "korea_html": render.korea_table_html([]), "economy_news": []}
+
+
+def save_dashboard(state, path=DASHBOARD_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
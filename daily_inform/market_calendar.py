@@ -0,0 +1,133 @@
+import datetime
+from zoneinfo import ZoneInfo
+
+# ==========================================
+# 거래소 거래 시간 / 휴장일
+# ==========================================
+# 시간별 주식 업데이트에서 장이 열려 있거나 막 마감된 심볼만 다시 조회하기 위해 사용.
+# 휴장일은 연 단위로 직접 관리 (새해가 되면 다음 해 목록 추가 필요).
+SETTLE_MINUTES = 20     # 마감 후 종가가 확정될 때까지 기다리는 시간
+
+KRX_HOLIDAYS = {
+    # 2026
+    "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-01",
+    "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25",
+    "2026-10-05", "2026-10-09", "2026-12-25", "2026-12-31",
+    # 2027
+    "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05", "2027-05-13",
+    "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16", "2027-10-04", "2027-10-11",
+    "2027-12-27", "2027-12-31",
+}
+
+NYSE_HOLIDAYS = {
+    # 2026
+    "2026-01-01", "2026-01-19", "2026-02-16", "2026-04-03", "2026-05-25", "2026-06-19",
+    "2026-07-03", "2026-09-07", "2026-11-26", "2026-12-25",
+    # 2027
+    "2027-01-01", "2027-01-18", "2027-02-15", "2027-03-26", "2027-05-31", "2027-06-18",
+    "2027-07-05", "2027-09-06", "2027-11-25", "2027-12-24",
+}
+
+NYSE_EARLY_CLOSES = {
+    "2026-11-27": datetime.time(13, 0), "2026-12-24": datetime.time(13, 0),
+    "2027-11-26": datetime.time(13, 0),
+}
+
+# CME 금/은 선물: 종일 휴장일(거래일 기준)과 미국 공휴일/연말 조기 마감 (ET)
+CME_HOLIDAYS = {
+    # 2026
+    "2026-01-01", "2026-04-03", "2026-12-25",
+    # 2027
+    "2027-01-01", "2027-03-26", "2027-12-24",
+}
+
+CME_EARLY_CLOSES = {
+    # 2026
+    "2026-01-19": datetime.time(13, 30), "2026-02-16": datetime.time(13, 30), "2026-05-25": datetime.time(13, 30),
+    "2026-06-19": datetime.time(13, 30), "2026-07-03": datetime.time(13, 30), "2026-09-07": datetime.time(13, 30),
+    "2026-11-26": datetime.time(13, 30), "2026-11-27": datetime.time(13, 45), "2026-12-24": datetime.time(13, 45),
+    # 2027
+    "2027-01-18": datetime.time(13, 30), "2027-02-15": datetime.time(13, 30), "2027-05-31": datetime.time(13, 30),
+    "2027-06-18": datetime.time(13, 30), "2027-07-05": datetime.time(13, 30), "2027-09-06": datetime.time(13, 30),
+    "2027-11-25": datetime.time(13, 30), "2027-11-26": datetime.time(13, 45),
+}
+
+# 외환: 성탄절/신정만 사실상 거래 없음 (주말과 겹치는 해는 생략)
+FX_HOLIDAYS = {
+    "2026-01-01", "2026-12-25",
+    "2027-01-01",
+}
+
+
+class Exchange:
+    def __init__(self, name, tz, open_time, close_time, holidays=(), early_closes=None, overnight=False):
+        self.name = name
+        self.tz = ZoneInfo(tz)
+        self.open_time = open_time
+        self.close_time = close_time
+        self.holidays = set(holidays)
+        self.early_closes = early_closes or {}
+        # overnight: 거래일 D 의 세션이 전날 저녁에 시작 (선물/외환)
+        self.overnight = overnight
+
+    def session(self, day):
+        # 거래일이면 (개장, 마감) aware datetime, 아니면 None
+        key = day.isoformat()
+        if day.weekday() >= 5 or key in self.holidays: return None
+        open_day = day - datetime.timedelta(days=1) if self.overnight else day
+        opens = datetime.datetime.combine(open_day, self.open_time, tzinfo=self.tz)
+        closes = datetime.datetime.combine(day, self.early_closes.get(key, self.close_time), tzinfo=self.tz)
+        return opens, closes
+
+    def is_open(self, now):
+        local_day = now.astimezone(self.tz).date()
+        for day in (local_day, local_day + datetime.timedelta(days=1)):
+            session = self.session(day)
+            if session and session[0] <= now < session[1]:
+                return True
+        return False
+
+    def last_close(self, now):
+        local_day = now.astimezone(self.tz).date()
+        for i in range(15):
+            session = self.session(local_day - datetime.timedelta(days=i))
+            if session and session[1] <= now:
+                return session[1]
+        return None
+
+
+EXCHANGES = {
+    "KRX": Exchange("KRX", "Asia/Seoul", datetime.time(9, 0), datetime.time(15, 30), KRX_HOLIDAYS),
+    "NYSE": Exchange("NYSE", "America/New_York", datetime.time(9, 30), datetime.time(16, 0),
+                     NYSE_HOLIDAYS, NYSE_EARLY_CLOSES),
+    # 금/은 선물: 일~금 18:00 - 17:00 (ET)
+    "COMEX": Exchange("COMEX", "America/New_York", datetime.time(18, 0), datetime.time(17, 0),
+                      CME_HOLIDAYS, CME_EARLY_CLOSES, overnight=True),
+    # 환율: 일~금 17:00 - 17:00 (ET), 사실상 24시간
+    "FX": Exchange("FX", "America/New_York", datetime.time(17, 0), datetime.time(17, 0), FX_HOLIDAYS, overnight=True),
+}
+
+SYMBOL_EXCHANGES = {
+    "^KS11": "KRX", "^KQ11": "KRX",
+    "^GSPC": "NYSE", "^IXIC": "NYSE",
+    "GC=F": "COMEX", "SI=F": "COMEX",
+    "KRW=X": "FX",
+}
+
+
+def exchange_for(symbol):
+    if symbol in SYMBOL_EXCHANGES: return EXCHANGES[SYMBOL_EXCHANGES[symbol]]
+    if symbol.endswith(('.KS', '.KQ')): return EXCHANGES["KRX"]
+    return EXCHANGES["NYSE"]
+
+
+def needs_refresh(symbol, now, last_fetched=None):
+    # 장중이면 항상, 장 마감 후에는 종가 확정(SETTLE_MINUTES) 이후 한 번만 조회
+    exchange = exchange_for(symbol)
+    if last_fetched is None or exchange.is_open(now):
+        return True
+    last_close = exchange.last_close(now)
+    if last_close is None:
+        return False
+    settled = last_close + datetime.timedelta(minutes=SETTLE_MINUTES)
+    return now >= settled and last_fetched < settled
@@ -0,0 +1,252 @@
+import asyncio
+import datetime
+import html
+import json
+import os
+import re
+import time
+
+from daily_inform import llm_dispatch, llm_router, prompt_builder
+from daily_inform.util import log
+
+# ==========================================
+# 뉴스 수집 및 로컬 AI 처리 (feedparser 는 피드를 받을 때만 import)
+# ==========================================
+PROMPT_FILE = 'prompt.md'
+FEED_CONFIG_FILE = 'feeds.json'
+MAX_NEW_ITEMS = 200
+MAX_PAPERS_COUNT = 8
+ECONOMY_PER_FEED = 4
+FEED_CONCURRENCY = 8        # 동시에 다운로드할 RSS 피드 수
+LLM_WORKERS_PER_ENDPOINT = 2
+QUEUE_SIZE = 16             # LLM 대기열이 가득 차면 피드 다운로드가 대기 (backpressure)
+
+
+class Translator:
+    def __init__(self, feeds_config, prompt_file=PROMPT_FILE):
+        self.routing = llm_router.load_routing(feeds_config)
+        log(f"🧭 Model routing: fast={self.routing['fast_model']}, strong={self.routing['strong_model']}")
+        self.dispatcher = llm_dispatch.OllamaDispatcher(self.routing["endpoints"], log=log)
+        log(f"🖥️ Ollama endpoints: {', '.join(self.routing['endpoints'])}")
+        self.prompts = None
+        if not os.path.exists(prompt_file):
+            log(f"❌ Error: {prompt_file} not found!")
+        else:
+            self.prompts = prompt_builder.PromptBuilder(prompt_file, snippet_tokens=self.routing["snippet_tokens"])
+
+    def translate(self, title, snippet, src=None):
+        # 프롬프트가 없으면 원문 그대로, LLM 이 모두 실패하면 None
+        if not self.prompts: return title, snippet
+
+        # 고정 지시사항은 system 에, 기사 데이터는 맨 뒤 user 메시지에 (prefix cache 재사용)
+        messages = self.prompts.build_messages(title, snippet)
+
+        # 작은 모델 먼저, 검증 실패 또는 논문이면 큰 모델로 (feeds.json "routing")
+        models = llm_router.pick_models(self.routing, src)
+        return llm_router.run_cascade(self.dispatcher.chat, models, messages, self.routing, log)
+
+
+def clean_html(raw_html):
+    if not raw_html: return ""
+    raw_html = str(raw_html)
+    unescaped = html.unescape(raw_html)
+    cleanr = re.compile('<.*?>', re.DOTALL)
+    text = re.sub(cleanr, '', unescaped)
+    cleaned = text.replace('&nbsp;', ' ').strip()
+    # log(f"DEBUG CLEAN: {raw_html[:30]}... -> {cleaned[:30]}...")
+    return cleaned
+
+
+def load_feeds():
+    if not os.path.exists(FEED_CONFIG_FILE):
+        log(f"⚠️ Warning: {FEED_CONFIG_FILE} not found! Using default empty lists.")
+        return {"economy": [], "robotics": []}
+    try:
+        with open(FEED_CONFIG_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        log(f"❌ Error loading {FEED_CONFIG_FILE}: {e}")
+        return {"economy": [], "robotics": []}
+
+
+KEYWORDS_HAND = ["hand", "gripper", "finger", "manipulation", "dexterous", "tactile", "grasping", "핸드", "그리퍼", "손", "매니퓰", "촉각", "파지"]
+KEYWORDS_HUMANOID = ["humanoid", "bipedal", "walking", "locomotion", "torso", "human-centered", "휴머노이드", "이족보행", "보행", "로코모션"]
+
+
+def classify_category(title, summary, current_cat):
+    # 만약 이미 hand 카테고리면 그대로 유지
+    if current_cat == 'hand': return 'hand'
+
+    text = (title + " " + (summary or "")).lower()
+
+    for kw in KEYWORDS_HAND:
+        if kw in text:
+            return "hand"
+
+    for kw in KEYWORDS_HUMANOID:
+        if kw in text:
+            return "humanoid"
+
+    return current_cat
+
+
+def item_keywords(item):
+    # 트렌드 집계용: 원문 제목 + 번역 제목/요약에서 매칭된 분류 키워드
+    text = " ".join([item.get('original_title', ''), item.get('title', ''), item.get('summary') or '']).lower()
+    return [kw for kw in KEYWORDS_HAND + KEYWORDS_HUMANOID if kw in text]
+
+
+def entry_pub_date(entry, default):
+    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+        return datetime.datetime.fromtimestamp(time.mktime(entry.published_parsed))
+    if hasattr(entry, 'updated_parsed') and entry.updated_parsed:
+        return datetime.datetime.fromtimestamp(time.mktime(entry.updated_parsed))
+    return default
+
+
+class NewsRun:
+    def __init__(self, archive, translator, trends=None):
+        self.archive = archive
+        self.translator = translator
+        self.trends = trends
+        self.existing_links = set(item['link'] for item in archive)
+        self.today = datetime.datetime.now()
+        self.economy = []
+        self.new_items_count = 0
+        self.paper_items_count = 0
+        self.in_progress = 0
+        self.papers_in_progress = 0
+
+
+async def produce_feed(run, queue, feed_sem, kind, feed_idx, src):
+    import feedparser
+    async with feed_sem:
+        try:
+            feed = await asyncio.to_thread(feedparser.parse, src["url"], agent="Mozilla/5.0")
+        except Exception as e:
+            log(f"RSS Error: {e}")
+            return
+    if kind == 'economy':
+        for entry_idx, entry in enumerate(feed.entries[:ECONOMY_PER_FEED]):
+            await queue.put((kind, (feed_idx, entry_idx), src, entry))
+        return
+    for entry in feed.entries:
+        link = entry.get('link')
+        if not link or link in run.existing_links: continue
+        if (run.today - entry_pub_date(entry, run.today)).days > 7: continue
+        # 같은 기사가 여러 피드에 있어도 한 번만 처리
+        run.existing_links.add(link)
+        await queue.put((kind, None, src, entry))
+
+
+async def handle_economy(run, order, src, entry):
+    raw_snippet = clean_html(entry.get('description', entry.get('summary', '')))
+    result = await asyncio.to_thread(run.translator.translate, entry.title, raw_snippet, src)
+    # 경제 뉴스는 저장하지 않으므로 번역 실패 시 원문으로 표시
+    t_ko, s_ko = result or (entry.title, raw_snippet)
+    pub_dt = entry_pub_date(entry, datetime.datetime.now())
+    run.economy.append((order, {
+        "title": t_ko,
+        "link": entry.link,
+        "summary": s_ko,
+        "source": src.get('title', 'Economy News'),
+        "date": pub_dt.strftime("%Y-%m-%d %H:%M")
+    }))
+
+
+async def handle_robotics(run, src, entry):
+    is_paper = src.get('cat') == 'paper'
+    # 처리 중인 항목까지 포함해 한도 확인 (동시 처리로 인한 초과 방지)
+    if run.new_items_count + run.in_progress >= MAX_NEW_ITEMS: return
+    if is_paper and run.paper_items_count + run.papers_in_progress >= MAX_PAPERS_COUNT: return
+
+    run.in_progress += 1
+    if is_paper: run.papers_in_progress += 1
+    try:
+        log(f"🧠 AI Processing: {entry.title[:40]}...")
+        raw_snippet = clean_html(entry.get('description', entry.get('summary', '')))
+        if not raw_snippet:
+            raw_snippet = entry.title
+
+        result = await asyncio.to_thread(run.translator.translate, entry.title, raw_snippet, src)
+        if result is None:
+            # 아카이브에 넣으면 중복 체크로 다시 번역되지 않으므로 다음 실행에서 재시도
+            log(f"⏭️ Translation failed, will retry next run: {entry.title[:40]}")
+            return
+        title_ko, summary_ko = result
+
+        # Determine category dynamically
+        final_cat = classify_category(title_ko, summary_ko, src['cat'])
+
+        # [STRICT FILTERING]
+        if is_paper and final_cat == 'paper':
+            log(f"🚫 Filtered out paper: {title_ko} (No keywords matched)")
+            return
+
+        news_item = {
+            "title": title_ko,
+            "original_title": entry.title,
+            "link": entry.link,
+            "date": entry_pub_date(entry, run.today).strftime("%Y-%m-%d %H:%M"),
+            "source": src['title'],
+            "category": final_cat,
+            "summary": summary_ko
+        }
+        run.archive.append(news_item)
+        if run.trends is not None:
+            run.trends.add(news_item, item_keywords(news_item))
+        run.new_items_count += 1
+        if is_paper: run.paper_items_count += 1
+    finally:
+        run.in_progress -= 1
+        if is_paper: run.papers_in_progress -= 1
+
+
+async def llm_worker(run, queue):
+    while True:
+        kind, order, src, entry = await queue.get()
+        try:
+            if kind == 'economy':
+                await handle_economy(run, order, src, entry)
+            else:
+                await handle_robotics(run, src, entry)
+        except Exception as e:
+            log(f"❌ Item Error ({src.get('title', '')}): {e}")
+        finally:
+            queue.task_done()
+
+
+async def collect_news(run, feeds_config):
+    log("📰 뉴스 수집 및 로컬 AI 처리...")
+    rss_economy = feeds_config.get("economy", [])
+    # Combine all robotics related feeds (humanoid, hand, paper, etc.)
+    rss_robotics = feeds_config.get("robotics", [])
+    rss_news = [src for src in rss_robotics if src.get('cat') != 'paper']
+    rss_papers = [src for src in rss_robotics if src.get('cat') == 'paper']
+
+    queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+    feed_sem = asyncio.Semaphore(FEED_CONCURRENCY)
+    n_workers = max(1, LLM_WORKERS_PER_ENDPOINT * len(run.translator.routing["endpoints"]))
+    workers = [asyncio.create_task(llm_worker(run, queue)) for _ in range(n_workers)]
+    try:
+        # News first, papers last (papers are limited): 논문은 뉴스 처리가 끝난 뒤 남은 한도 안에서만 처리
+        producers = [produce_feed(run, queue, feed_sem, 'economy', i, src) for i, src in enumerate(rss_economy)]
+        producers += [produce_feed(run, queue, feed_sem, 'robotics', i, src) for i, src in enumerate(rss_news)]
+        await asyncio.gather(*producers)
+        await queue.join()
+        await asyncio.gather(*[produce_feed(run, queue, feed_sem, 'robotics', i, src) for i, src in enumerate(rss_papers)])
+        await queue.join()
+    finally:
+        for w in workers: w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    run.economy.sort(key=lambda x: x[0])
+    log(f"📰 뉴스 처리 완료 (new: {run.new_items_count}, papers: {run.paper_items_count})")
+    return [item for _, item in run.economy]
+
+
+def reclassify(archive):
+    # 기존 아카이브 재분류 (Re-classify existing items)
+    for item in archive:
+        if 'title' not in item: continue
+        item['category'] = classify_category(item['title'], item.get('summary', ''), item['category'])
@@ -0,0 +1,95 @@
+import asyncio
+import os
+
+from daily_inform import archive_store, market, news, render, trends
+from daily_inform.util import log
+
+# ==========================================
+# 실행 흐름 (시장 데이터 / 뉴스 / 렌더링)
+# ==========================================
+
+
+def split_categories(archive):
+    latest_humanoid = [x for x in archive if x['category'] == 'humanoid']
+    latest_hand = [x for x in archive if x['category'] == 'hand']
+    return latest_humanoid, latest_hand
+
+
+def render_index(state, latest_humanoid, latest_hand, now_str=None):
+    render.render_index(state["metrics"], state["korea_html"], state["economy_news"],
+                        latest_humanoid, latest_hand, now_str=now_str)
+
+
+def load_trends(archive):
+    counter = trends.load_trends()
+    if counter is None:
+        counter = trends.rebuild(archive, news.item_keywords)
+    counter.expire()
+    return counter
+
+
+def render_all(now_str=None):
+    # 네트워크 없이 마지막 스냅샷과 아카이브로 두 페이지를 다시 생성
+    now_str = now_str or render.kst_now_str()
+    archive = archive_store.load_archive()
+    latest_humanoid, latest_hand = split_categories(archive)
+    render.render_news_page(latest_humanoid, latest_hand, now_str=now_str, trends=load_trends(archive))
+    if not os.path.exists(market.DASHBOARD_FILE):
+        # 스냅샷이 없으면 빈 placeholder 로 index.html 을 덮어쓰지 않음
+        log(f"⚠️ {market.DASHBOARD_FILE} 없음 → index.html 유지 (market 또는 news 를 먼저 실행)")
+        return
+    render_index(market.load_dashboard(), latest_humanoid, latest_hand, now_str)
+
+
+def update_market(refresh_all=False):
+    # 시장 데이터만 갱신 (뉴스는 기존 데이터 유지)
+    state = market.load_dashboard()
+    refreshed = asyncio.run(market.refresh_market(state, intraday=True, only_needed=not refresh_all))
+    if not refreshed:
+        # 갱신된 값이 없으면 index.html 도 그대로 두어 빈 커밋을 만들지 않음
+        return False
+    state["updated"] = render.kst_now_str()
+    market.save_dashboard(state)
+    log("📝 HTML 갱신 (뉴스는 기존 데이터 유지)...")
+    latest_humanoid, latest_hand = split_categories(archive_store.load_archive())
+    render_index(state, latest_humanoid[:4], latest_hand[:4], state["updated"])
+    return True
+
+
+async def _update_news():
+    feeds_config = news.load_feeds()
+    translator = news.Translator(feeds_config)
+    archive = archive_store.load_archive()
+    news.reclassify(archive)
+    trend_counter = load_trends(archive)
+    run = news.NewsRun(archive, translator, trend_counter)
+
+    # 시장 데이터(네트워크)와 뉴스 수집/번역(GPU)을 동시에 진행
+    state = market.load_dashboard()
+    market_task = asyncio.create_task(market.refresh_market(state))
+    try:
+        economy_news_latest = await news.collect_news(run, feeds_config)
+    except BaseException:
+        # 뉴스 수집이 실패하면 시장 작업도 정리한 뒤 오류 전달
+        market_task.cancel()
+        await asyncio.gather(market_task, return_exceptions=True)
+        raise
+
+    # hot 범위를 넘는 오래된 기사는 월별 압축 세그먼트(archive/)로 이동
+    archive_store.save_archive(archive)
+    trends.save_trends(trend_counter)
+
+    # news.html 은 시장 데이터와 무관하므로 먼저 렌더링
+    log("📝 HTML 생성...")
+    latest_humanoid, latest_hand = split_categories(archive)
+    now_str = render.kst_now_str()
+    await asyncio.to_thread(render.render_news_page, latest_humanoid, latest_hand, now_str=now_str, trends=trend_counter)
+
+    await market_task
+    state.update(economy_news=economy_news_latest, updated=now_str)
+    market.save_dashboard(state)
+    render_index(state, latest_humanoid, latest_hand, now_str)
+
+
+def update_news():
+    asyncio.run(_update_news())
@@ -0,0 +1,82 @@
+import re
+
+# ==========================================
+# 프롬프트 빌더 (KV prefix cache 재사용용 레이아웃)
+# ==========================================
+# prompt.md 를 한 번만 읽어서 고정 지시사항(system)과 기사 데이터(user)로 분리.
+# 고정 부분이 항상 앞에 오므로 Ollama 가 매 요청마다 같은 prefix 를 재사용할 수 있음.
+SYSTEM_ROLE = '당신은 한국의 베테랑 IT 및 로보틱스 전문 기자입니다. 반드시 한국어로만 응답하세요.'
+PLACEHOLDER_RE = re.compile(r'\{(title|snippet)\}')
+WIDE_CHAR_RE = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ一-鿿]')
+
+DEFAULT_TITLE_TOKENS = 64
+DEFAULT_SNIPPET_TOKENS = 400
+
+
+def estimate_tokens(text):
+    # 토크나이저 없이 근사: 한글/한자 1글자 ≈ 1토큰, 그 외 4글자 ≈ 1토큰
+    if not text: return 0
+    wide = len(WIDE_CHAR_RE.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+
+def trim_to_budget(text, max_tokens):
+    if estimate_tokens(text) <= max_tokens: return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) <= max_tokens: lo = mid
+        else: hi = mid - 1
+    cut = text[:lo]
+    # 문장 → 단어 경계에서 자르기
+    for sep in ('. ', '다. ', ' '):
+        pos = cut.rfind(sep)
+        if pos > len(cut) // 2:
+            cut = cut[:pos + len(sep)]
+            break
+    return cut.rstrip() + " …"
+
+
+def compile_template(template):
+    # 섹션(# 헤더 단위) 중 내용이 전부 {title}/{snippet} 줄이면 통째로 뒤로 이동,
+    # 그 외 섹션에 섞인 변수 줄은 그 줄만 뒤로 이동
+    sections, current = [], []
+    for line in template.splitlines():
+        if line.startswith('#') and current:
+            sections.append(current)
+            current = []
+        current.append(line)
+    if current: sections.append(current)
+
+    static_lines, variable_lines = [], []
+    for section in sections:
+        body = [l for l in section[1:] if l.strip()]
+        if section[0].startswith('#') and body and all(PLACEHOLDER_RE.search(l) for l in body):
+            variable_lines.extend(l for l in section if l.strip())
+            continue
+        for line in section:
+            (variable_lines if PLACEHOLDER_RE.search(line) else static_lines).append(line)
+
+    static = "\n".join(static_lines).strip()
+    variable = "\n".join(variable_lines).strip()
+    return static, variable
+
+
+class PromptBuilder:
+    def __init__(self, path, title_tokens=DEFAULT_TITLE_TOKENS, snippet_tokens=DEFAULT_SNIPPET_TOKENS):
+        with open(path, 'r', encoding='utf-8') as f:
+            self.static, self.variable = compile_template(f.read())
+        self.system_content = SYSTEM_ROLE + "\n\n" + self.static
+        self.title_tokens = title_tokens
+        self.snippet_tokens = snippet_tokens
+
+    def build_messages(self, title, snippet):
+        values = {
+            "title": trim_to_budget(title, self.title_tokens),
+            "snippet": trim_to_budget(snippet, self.snippet_tokens),
+        }
+        user_content = PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], self.variable)
+        return [
+            {'role': 'system', 'content': self.system_content},
+            {'role': 'user', 'content': user_content}
+        ]
@@ -0,0 +1,141 @@
+import os
+import subprocess
+import tempfile
+import time
+
+from daily_inform.util import log
+
+# ==========================================
+# Git 동기화 / 배포
+# ==========================================
+# - 결과물(ARTIFACTS) 중 내용 해시가 HEAD 와 다른 파일만 stage (git add . 대신)
+# - HEAD 가 window 초 안에 만든, 아직 push 되지 않은 배포 커밋이면 새 커밋 대신 amend 로 합침 (coalesce)
+#   (이미 push 된 커밋을 amend 하면 다른 clone 의 pull 에서 다시 merge 되고,
+#    shallow clone 에서는 부모 없는 커밋이 되어 히스토리 전체를 덮어쓰므로 하지 않음)
+# - pages_branch 를 지정하면 웹 결과물만 담은 단일 커밋(히스토리 없음)을 해당 브랜치로 force push 하고,
+#   현재 브랜치에는 데이터(STATE_ARTIFACTS)만 커밋
+COMMIT_MESSAGE = "Local AI Update (RTX 5060 Ti)"
+PAGES_MESSAGE = "Publish generated pages"
+PAGE_ARTIFACTS = ['.nojekyll', 'index.html', 'news.html', 'archive']
+STATE_ARTIFACTS = ['news_archive.json', 'dashboard_state.json', 'trends.json', 'archive']
+ARTIFACTS = ['index.html', 'news.html', 'news_archive.json', 'dashboard_state.json', 'trends.json', 'archive']
+
+
+def git(args, cwd='.', env=None, input=None, check=True):
+    result = subprocess.run(["git", *args], cwd=cwd, env=env, input=input,
+                            capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def git_pull(cwd='.'):
+    log("📥 Git Pull...")
+    subprocess.run(["git", "pull", "--no-rebase", "--strategy-option", "theirs"], cwd=cwd)
+
+
+def artifact_files(paths=ARTIFACTS, cwd='.'):
+    files = []
+    for path in paths:
+        full = os.path.join(cwd, path)
+        if os.path.isdir(full):
+            for root, _, names in os.walk(full):
+                for name in sorted(names):
+                    files.append(os.path.relpath(os.path.join(root, name), cwd))
+        elif os.path.isfile(full):
+            files.append(path)
+    return sorted(f for f in files if not f.endswith('.tmp'))
+
+
+def head_blobs(cwd='.'):
+    if git(["rev-parse", "--verify", "-q", "HEAD"], cwd=cwd, check=False) == "":
+        return {}
+    blobs = {}
+    for entry in git(["ls-tree", "-r", "-z", "HEAD"], cwd=cwd).split('\0'):
+        if not entry: continue
+        meta, path = entry.split('\t', 1)
+        blobs[path] = meta.split()[2]
+    return blobs
+
+
+def hash_files(files, cwd='.', write=False):
+    if not files: return {}
+    args = ["hash-object", "--stdin-paths"] + (["-w"] if write else [])
+    hashes = git(args, cwd=cwd, input="\n".join(files) + "\n").splitlines()
+    return dict(zip(files, hashes))
+
+
+def changed_artifacts(paths=ARTIFACTS, cwd='.'):
+    # 작업 트리의 내용 해시와 HEAD 의 blob 해시 비교
+    current = hash_files(artifact_files(paths, cwd), cwd)
+    committed = head_blobs(cwd)
+    return [path for path, blob in current.items() if committed.get(path) != blob]
+
+
+def is_pushed(commit, remote='origin', cwd='.'):
+    return bool(git(["for-each-ref", "--contains", commit, "--format=%(refname)", f"refs/remotes/{remote}/"],
+                    cwd=cwd, check=False))
+
+
+def can_coalesce(message, window, remote='origin', cwd='.'):
+    # HEAD 가 같은 메시지의 배포 커밋이고, 처음 만들어진 시각(author date)이 window 이내이며, 아직 push 전인지
+    if not window: return False
+    if git(["rev-parse", "--is-shallow-repository"], cwd=cwd, check=False) != "false": return False
+    out = git(["log", "-1", "--format=%at%x00%s"], cwd=cwd, check=False)
+    if not out: return False
+    author_time, subject = out.split('\x00', 1)
+    if subject != message or time.time() - int(author_time) >= window: return False
+    return not is_pushed("HEAD", remote, cwd)
+
+
+def publish_pages(branch, paths=PAGE_ARTIFACTS, remote='origin', message=PAGES_MESSAGE, cwd='.'):
+    # 별도 index 파일로 결과물만 담은 tree 를 만들어 부모 없는 커밋으로 force push
+    files = artifact_files(paths, cwd)
+    if not files:
+        log("⚠️ No artifacts to publish")
+        return False
+    hashes = hash_files(files, cwd, write=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, GIT_INDEX_FILE=os.path.join(tmp, 'index'))
+        entries = "".join(f"100644 {hashes[f]}\t{f}\n" for f in files)
+        git(["update-index", "--add", "--index-info"], cwd=cwd, env=env, input=entries)
+        tree = git(["write-tree"], cwd=cwd, env=env)
+
+    if git(["ls-remote", remote, f"refs/heads/{branch}"], cwd=cwd, check=False):
+        git(["fetch", "-q", remote, f"refs/heads/{branch}"], cwd=cwd, check=False)
+        if git(["rev-parse", "-q", "--verify", "FETCH_HEAD^{tree}"], cwd=cwd, check=False) == tree:
+            log(f"✅ {branch}: 변경 없음 (push 생략)")
+            return False
+
+    commit = git(["commit-tree", tree, "-m", message], cwd=cwd)
+    git(["push", "-q", "--force", remote, f"{commit}:refs/heads/{branch}"], cwd=cwd)
+    log(f"📤 {branch} 브랜치에 {len(files)}개 파일 배포 (squashed)")
+    return True
+
+
+def publish(message=COMMIT_MESSAGE, paths=None, window=0, pages_branch=None, remote='origin', cwd='.'):
+    log("📤 GitHub로 업로드 중...")
+    try:
+        if pages_branch:
+            publish_pages(pages_branch, remote=remote, cwd=cwd)
+        if paths is None:
+            paths = STATE_ARTIFACTS if pages_branch else ARTIFACTS
+
+        changed = changed_artifacts(paths, cwd)
+        if not changed:
+            log("✅ 변경된 결과물 없음 (커밋 생략)")
+            return False
+
+        git(["add", "--", *changed], cwd=cwd)
+        if can_coalesce(message, window, remote, cwd):
+            # push 되지 못한 직전 배포 커밋(예: 네트워크 오류)에 합쳐서 한 번에 push
+            log(f"🔗 최근 {window}초 안의 미전송 배포 커밋에 합침 (amend)")
+            git(["commit", "-q", "--amend", "-m", message], cwd=cwd)
+        else:
+            git(["commit", "-q", "-m", message], cwd=cwd)
+        git(["push", "-q", remote, "HEAD"], cwd=cwd)
+        log(f"✅ 완료! {len(changed)}개 파일 업데이트: {', '.join(changed[:5])}{' ...' if len(changed) > 5 else ''}")
+        return True
+    except Exception as e:
+        log(f"❌ Git Upload Error: {e}")
+        return False
@@ -0,0 +1,156 @@
+import datetime
+import os
+import re
+
+# ==========================================
+# HTML 렌더링 (local_update.py / update_stock.py / update.py 공용)
+# ==========================================
+# {{PLACEHOLDER}} 템플릿을 한 번 파싱해 [문자열, 변수, 문자열, ...] 형태로 컴파일하고
+# 렌더링은 한 번의 join 으로 처리 (replace 체인처럼 문서 전체를 반복 복사하지 않음).
+PLACEHOLDER_RE = re.compile(r'\{\{([A-Z0-9_]+)\}\}')
+
+_template_cache = {}
+
+
+class Template:
+    def __init__(self, text):
+        # 짝수 인덱스 = 고정 문자열, 홀수 인덱스 = 변수 이름
+        self.parts = PLACEHOLDER_RE.split(text)
+        self.names = set(self.parts[1::2])
+
+    def render(self, context):
+        out = self.parts[:]
+        for i in range(1, len(out), 2):
+            name = out[i]
+            # 값이 없는 변수는 그대로 남겨둠 (기존 replace 방식과 동일)
+            out[i] = str(context[name]) if name in context else '{{' + name + '}}'
+        return "".join(out)
+
+
+def load_template(path):
+    mtime = os.path.getmtime(path)
+    cached = _template_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        template = Template(f.read())
+    _template_cache[path] = (mtime, template)
+    return template
+
+
+def render_to_file(template_path, context, out_path):
+    html = load_template(template_path).render(context)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+
+
+def kst_now_str():
+    utc_now = datetime.datetime.now(datetime.timezone.utc)
+    kst_now = utc_now + datetime.timedelta(hours=9)
+    return kst_now.strftime("%Y-%m-%d %H:%M:%S (KST)")
+
+
+# ==========================================
+# HTML 조각 (fragment) 생성
+# ==========================================
+def market_context(metrics):
+    # {"KOSPI": (val, change, chart), ...} → {"KOSPI_VAL": ..., "KOSPI_CHANGE": ..., "KOSPI_CHART": ...}
+    context = {}
+    for key, (val, chg, chart) in metrics.items():
+        context[key + '_VAL'] = val
+        context[key + '_CHANGE'] = chg
+        context[key + '_CHART'] = chart
+    return context
+
+
+def korea_row_html(code, name, naver_code, curr, pct, chart):
+    if pct > 0: color_cls, sign = "bg-red-light text-red", "+"
+    elif pct < 0: color_cls, sign = "bg-blue-light text-blue", ""
+    else: color_cls, sign = "text-gray", ""
+    link_url = f"https://finance.naver.com/item/main.naver?code={naver_code}"
+    return f"<tr onclick=\"window.open('{link_url}', '_blank')\" style=\"cursor:pointer;\"><td><span class='stock-name'>{name} 🔗</span><span class='stock-code'>{code}</span></td><td class='stock-price'>{curr:,.0f}원</td><td><span class='{color_cls}'>{sign}{pct:.2f}%</span></td><td><img src='{chart}' style='height:30px; width:80px;'></td></tr>"
+
+
+def korea_table_html(rows):
+    return "".join([
+        "<table class='stock-table'><thead><tr><th>종목명</th><th>현재가</th><th>등락률</th><th>추세(1달)</th></tr></thead><tbody>",
+        *rows,
+        "</tbody></table>",
+    ])
+
+
+def generate_simple_list(items):
+    parts = []
+    for item in items[:4]:
+        title = item.get('title') if isinstance(item, dict) else item.title
+        link = item.get('link') if isinstance(item, dict) else item.link
+        summary = item.get('summary') if isinstance(item, dict) else getattr(item, 'summary', '')
+        source = item.get('source', '') if isinstance(item, dict) else ''
+        date = item.get('date', '') if isinstance(item, dict) else ''
+
+        summary_html = f"<div style='font-size:0.9rem; color:#666; margin-top:4px;'>{summary}</div>" if summary else ""
+        meta_html = f"<div style='font-size:0.8rem; color:#999; margin-top:2px;'>{source} | {date[:10]}</div>" if source or date else ""
+        parts.append(f"<li class='news-item'><a href='{link}' target='_blank'>{title}</a>{summary_html}{meta_html}</li>")
+    return "".join(parts)
+
+
+def generate_card_list(items):
+    parts = []
+    for item in items:
+        if 'title' not in item: continue
+        summary_html = f"<div class='news-summary' style='color:#555; font-size:0.95rem; margin-top:8px; line-height:1.6;'>💡 {item.get('summary', '')}</div>" if item.get('summary') else ""
+        original_title = item.get('original_title', '').replace("'", "&#39;")
+        # Star icon added
+        star_icon = f"<span class='star-btn' onclick='toggleStar(this, \"{item['link']}\")' style='cursor:pointer; margin-right:8px; font-size:1.2rem; color:#ccc;'>☆</span>"
+        parts.append(f"""<div class='news-card' data-link='{item['link']}'><div style='display:flex; align-items:flex-start;'>{star_icon}<a href='{item['link']}' target='_blank' class='news-title' style='flex:1;'>{item['title']}</a></div><div class='hidden-keywords' style='display:none;'>{original_title}</div>{summary_html}<div class='news-meta' style='margin-top:10px;'><span class='source-tag'>{item['source']}</span><span class='date-tag'>{item['date'][:10]}</span></div></div>""")
+    return "".join(parts)
+
+
+def news_content_html(economy, humanoid, hand):
+    parts = []
+    if economy:
+        parts.append(f"<div class='news-category'><h4><span class='badge'>📈 증시/경제</span></h4><ul class='news-list'>{generate_simple_list(economy)}</ul></div>")
+    if humanoid:
+        parts.append(f"<div class='news-category'><h4><span class='badge'>🤖 휴머노이드</span></h4><ul class='news-list'>{generate_simple_list(humanoid)}</ul></div>")
+    if hand:
+        parts.append(f"<div class='news-category'><h4><span class='badge'>🦾 핸드/그리퍼</span></h4><ul class='news-list'>{generate_simple_list(hand)}</ul></div>")
+    return "".join(parts)
+
+
+def _trend_chips(pairs):
+    if not pairs: return "<span style='color:#aaa;'>-</span>"
+    return "".join(f"<span class='source-tag' style='display:inline-block; margin:2px 4px 2px 0;'>{name} <b>{count}</b></span>" for name, count in pairs)
+
+
+def trends_html(counter, n=5, today=None):
+    # 미리 집계된 카운터에서 Top-N 만 읽으므로 아카이브 크기와 무관
+    if counter is None: return ""
+    rows = [
+        ("🤖 휴머노이드 키워드 (7일)", counter.top_keywords(7, n, 'humanoid', today)),
+        ("🦾 핸드/그리퍼 키워드 (7일)", counter.top_keywords(7, n, 'hand', today)),
+        ("📰 주요 소스 (30일)", counter.top_sources(30, n, today=today)),
+    ]
+    parts = ["<div class='trends-panel' style='background:#fff; border-radius:8px; padding:12px 16px; margin-bottom:20px; font-size:0.9rem;'>",
+             "<div style='font-weight:700; margin-bottom:8px;'>🔥 이번 주 트렌드</div>"]
+    for label, pairs in rows:
+        parts.append(f"<div style='margin:4px 0;'><span style='color:#666; margin-right:8px;'>{label}</span>{_trend_chips(pairs)}</div>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def render_index(metrics, korea_html, economy, humanoid, hand, template_path='template.html', out_path='index.html', now_str=None):
+    context = market_context(metrics)
+    context['LAST_UPDATED'] = now_str or kst_now_str()
+    context['KOREA_MARKET_HTML'] = korea_html
+    context['NEWS_CONTENT'] = news_content_html(economy, humanoid, hand)
+    render_to_file(template_path, context, out_path)
+
+
+def render_news_page(humanoid, hand, template_path='news_template.html', out_path='news.html', now_str=None, trends=None):
+    # Economy section removed from news.html
+    render_to_file(template_path, {
+        'LAST_UPDATED': now_str or kst_now_str(),
+        'TRENDS_HTML': trends_html(trends),
+        'HUMANOID_NEWS_FULL': generate_card_list(humanoid),
+        'HAND_NEWS_FULL': generate_card_list(hand),
+    }, out_path)
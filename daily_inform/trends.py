@@ -0,0 +1,78 @@
+import datetime
+import json
+import os
+
+# ==========================================
+# 키워드 / 소스 트렌드 집계 (증분 업데이트)
+# ==========================================
+# 일자 × 카테고리 × 소스 × 키워드 카운터를 trends.json 에 유지.
+# 새 기사가 들어올 때만 더하고, KEEP_DAYS 를 지난 일자 버킷은 통째로 빼므로
+# 7/30일 Top-N 계산 비용은 아카이브 크기와 무관함.
+TRENDS_FILE = 'trends.json'
+KEEP_DAYS = 30
+ITEM_KEY = '*'      # 키워드와 무관한 기사 수 (소스 트렌드용)
+
+
+class TrendCounter:
+    def __init__(self, days=None):
+        # {"YYYY-MM-DD": {category: {source: {keyword: count}}}}
+        self.days = days or {}
+
+    def add(self, item, keywords, today=None):
+        day = item['date'][:10]
+        if day < _cutoff(today, KEEP_DAYS): return
+        by_source = self.days.setdefault(day, {}).setdefault(item['category'], {}).setdefault(item['source'], {})
+        for kw in [ITEM_KEY, *set(keywords)]:
+            by_source[kw] = by_source.get(kw, 0) + 1
+
+    def expire(self, today=None, keep_days=KEEP_DAYS):
+        cutoff = _cutoff(today, keep_days)
+        for day in [d for d in self.days if d < cutoff]:
+            del self.days[day]
+
+    def _iter(self, days, today, category):
+        cutoff = _cutoff(today, days)
+        for day, by_cat in self.days.items():
+            if day < cutoff: continue
+            for cat, by_source in by_cat.items():
+                if category and cat != category: continue
+                yield from by_source.items()
+
+    def top_keywords(self, days=7, n=5, category=None, today=None):
+        totals = {}
+        for _, counts in self._iter(days, today, category):
+            for kw, count in counts.items():
+                if kw != ITEM_KEY: totals[kw] = totals.get(kw, 0) + count
+        return sorted(totals.items(), key=lambda x: (-x[1], x[0]))[:n]
+
+    def top_sources(self, days=7, n=5, category=None, today=None):
+        totals = {}
+        for source, counts in self._iter(days, today, category):
+            totals[source] = totals.get(source, 0) + counts.get(ITEM_KEY, 0)
+        return sorted(totals.items(), key=lambda x: (-x[1], x[0]))[:n]
+
+
+def _cutoff(today, days):
+    today = today or datetime.date.today()
+    return (today - datetime.timedelta(days=days - 1)).isoformat()
+
+
+def load_trends(path=TRENDS_FILE):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return TrendCounter(json.load(f))
+    return None
+
+
+def save_trends(counter, path=TRENDS_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(counter.days.items(), reverse=True)), f, ensure_ascii=False, indent=1)
+
+
+def rebuild(archive, keywords_for, today=None):
+    # trends.json 이 없을 때 한 번만 아카이브 전체로 초기화
+    counter = TrendCounter()
+    for item in archive:
+        if 'title' not in item: continue
+        counter.add(item, keywords_for(item), today)
+    return counter
@@ -5,4 +5,4 @@ cd /home/younlea/source-code/daily_inform
 exec 200>/tmp/daily_inform.lock
 flock -n 200 || { echo "$(date): previous run still in progress, skipping" >> update.log; exit 0; }
 
-/usr/bin/python3 local_update.py >> update.log 2>&1
+/usr/bin/python3 -m daily_inform run >> update.log 2>&1
@@ -0,0 +1,33 @@
+from daily_inform import archive_store
+
+
+def make_item(i, month):
+    return {"title": f"t{i}", "link": f"https://example.com/{i}", "date": f"{month}-{10 + i % 10:02d} 09:00",
+            "category": "humanoid", "source": "s", "summary": "요약"}
+
+
+def test_overflow_rolls_into_monthly_segments(tmp_path):
+    hot_path = str(tmp_path / "news_archive.json")
+    cold_dir = str(tmp_path / "archive")
+    data = [make_item(i, "2026-08") for i in range(5)] + [make_item(i, "2026-07") for i in range(5, 10)]
+
+    archive_store.save_archive(data, path=hot_path, hot_items=4, cold_dir=cold_dir)
+    assert len(data) == 4 and len(archive_store.load_archive(hot_path)) == 4
+
+    index = archive_store.load_index(cold_dir)
+    assert [(s['month'], s['count']) for s in index['segments']] == [("2026-08", 1), ("2026-07", 5)]
+    assert archive_store.find_item("https://example.com/7", hot=data, cold_dir=cold_dir)['title'] == "t7"
+    assert archive_store.find_item("https://example.com/404", hot=data, cold_dir=cold_dir) is None
+
+
+def test_segments_merge_without_duplicates(tmp_path):
+    hot_path = str(tmp_path / "news_archive.json")
+    cold_dir = str(tmp_path / "archive")
+    archive_store.save_archive([make_item(i, "2026-07") for i in range(3)], path=hot_path, hot_items=0, cold_dir=cold_dir)
+    first = (tmp_path / "archive" / "2026-07.json.gz").read_bytes()
+    archive_store.save_archive([make_item(i, "2026-07") for i in range(3)], path=hot_path, hot_items=0, cold_dir=cold_dir)
+    # 같은 내용이면 세그먼트 파일도 동일
+    assert (tmp_path / "archive" / "2026-07.json.gz").read_bytes() == first
+
+    archive_store.save_archive([make_item(i, "2026-07") for i in range(2, 6)], path=hot_path, hot_items=0, cold_dir=cold_dir)
+    assert len(archive_store.load_segment("2026-07", cold_dir)) == 6
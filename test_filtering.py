@@ -1,24 +1,7 @@
 import sys
 import os
 
-# Mocking the classify logic to test it in isolation
-def classify_category(title, summary, current_cat):
-    if current_cat == 'hand': return 'hand'
-    
-    keywords_hand = ["hand", "gripper", "finger", "manipulation", "dexterous", "tactile", "grasping", "핸드", "그리퍼", "손", "매니퓰", "촉각", "파지"]
-    keywords_humanoid = ["humanoid", "bipedal", "walking", "locomotion", "torso", "human-centered", "휴머노이드", "이족보행", "보행", "로코모션"]
-    
-    text = (title + " " + (summary or "")).lower()
-    
-    for kw in keywords_hand:
-        if kw in text:
-            return "hand"
-            
-    for kw in keywords_humanoid:
-        if kw in text:
-            return "humanoid"
-            
-    return current_cat
+from daily_inform.news import classify_category
 
 # Test cases
 test_cases = [
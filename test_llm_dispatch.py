@@ -0,0 +1,117 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from daily_inform import llm_dispatch, llm_router, news
+
+
+def start_stub(status=200, content="휴머노이드 공개 ||| 새로운 로봇이 공개됨.", fail_first=0, missing=()):
+    # /api/chat 만 흉내내는 로컬 Ollama 스텁 서버 (fail_first: 처음 N개 요청은 500, missing: 404 를 낼 모델)
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            hits.append(body['model'])
+            code = 500 if len(hits) <= fail_first else 404 if body['model'] in missing else status
+            if code == 200:
+                payload = {"message": {"role": "assistant", "content": content}}
+            else:
+                payload = {"error": f"model '{body['model']}' not found"}
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}", hits
+
+
+def test_fails_over_on_missing_model():
+    bad, bad_url, bad_hits = start_stub(status=404)
+    good, good_url, good_hits = start_stub()
+    try:
+        dispatcher = llm_dispatch.OllamaDispatcher([bad_url, good_url], log=lambda m: None)
+        for _ in range(3):
+            result = dispatcher.chat(model="gemma4:latest", messages=[])
+            assert result['message']['content'].startswith("휴머노이드")
+        # 404 를 낸 서버는 같은 모델 요청에서 제외됨
+        assert bad_hits == ["gemma4:latest"]
+        assert good_hits == ["gemma4:latest"] * 3
+    finally:
+        bad.shutdown()
+        good.shutdown()
+
+
+def test_prefers_least_loaded_endpoint():
+    a, a_url, a_hits = start_stub()
+    b, b_url, b_hits = start_stub()
+    try:
+        dispatcher = llm_dispatch.OllamaDispatcher([a_url, b_url], log=lambda m: None)
+        dispatcher.endpoints[0].in_flight = 1
+        dispatcher.chat(model="m", messages=[])
+        assert b_hits == ["m"] and a_hits == []
+    finally:
+        a.shutdown()
+        b.shutdown()
+
+
+def test_raises_when_all_endpoints_fail():
+    dispatcher = llm_dispatch.OllamaDispatcher(["http://127.0.0.1:9"], timeout=2, log=lambda m: None)
+    try:
+        dispatcher.chat(model="m", messages=[])
+    except llm_dispatch.DispatchError:
+        pass
+    else:
+        assert False, "expected DispatchError"
+
+
+def test_single_endpoint_recovers_after_transient_error():
+    server, url, hits = start_stub(fail_first=1)
+    try:
+        dispatcher = llm_dispatch.OllamaDispatcher([url], log=lambda m: None)
+        routing = llm_router.load_routing({})
+        results = [llm_router.run_cascade(dispatcher.chat, ["m"], [], routing, log=lambda m: None) for _ in range(4)]
+        # 첫 요청만 실패하고, 유일한 서버가 쿨다운 중이어도 이후 요청은 계속 전달됨
+        assert results[0] is None
+        assert all(r[0].startswith("휴머노이드") for r in results[1:])
+        assert len(hits) == 4
+    finally:
+        server.shutdown()
+
+
+def test_missing_model_escalates_without_request():
+    server, url, hits = start_stub(missing=("small",))
+    try:
+        dispatcher = llm_dispatch.OllamaDispatcher([url], log=lambda m: None)
+        routing = llm_router.load_routing({})
+        for _ in range(5):
+            result = llm_router.run_cascade(dispatcher.chat, ["small", "big"], [], routing, log=lambda m: None)
+            assert result[0].startswith("휴머노이드")
+        # 404 는 한 번만, 이후에는 요청 없이 바로 큰 모델로
+        assert hits == ["small"] + ["big"] * 5
+    finally:
+        server.shutdown()
+
+
+class Entry(dict):
+    __getattr__ = dict.get
+
+
+class FailingTranslator:
+    def translate(self, title, snippet, src=None):
+        return None
+
+
+def test_untranslated_item_is_not_archived():
+    run = news.NewsRun([], FailingTranslator())
+    entry = Entry(title="Humanoid robot unveiled", link="https://example.com/1", summary="A new humanoid.")
+    asyncio.run(news.handle_robotics(run, {"title": "src", "cat": "humanoid"}, entry))
+    assert run.archive == [] and run.new_items_count == 0
@@ -0,0 +1,41 @@
+from daily_inform import llm_router
+
+ROUTING = llm_router.load_routing({"routing": {"fast_model": "small", "strong_model": "big"}})
+
+
+def fake_chat(replies):
+    calls = []
+    def chat(model, messages):
+        calls.append(model)
+        return {'message': {'content': replies[model]}}
+    return chat, calls
+
+
+def test_pick_models():
+    assert llm_router.pick_models(ROUTING, {"cat": "humanoid"}) == ["small", "big"]
+    assert llm_router.pick_models(ROUTING, {"cat": "paper"}) == ["big"]
+    assert llm_router.pick_models(ROUTING, {"cat": "hand", "model": "strong"}) == ["big"]
+    assert llm_router.pick_models(ROUTING, {"cat": "paper", "model": "fast"}) == ["small", "big"]
+
+
+def test_fast_model_accepted():
+    chat, calls = fake_chat({"small": "휴머노이드 공개 ||| 새로운 휴머노이드 로봇이 공개됨."})
+    result = llm_router.run_cascade(chat, ["small", "big"], [], ROUTING, log=lambda m: None)
+    assert result == ("휴머노이드 공개", "새로운 휴머노이드 로봇이 공개됨.")
+    assert calls == ["small"]
+
+
+def test_escalates_on_invalid_output():
+    chat, calls = fake_chat({
+        "small": "Humanoid unveiled ||| A new humanoid robot.",
+        "big": "휴머노이드 공개 ||| 새로운 휴머노이드 로봇이 공개됨.",
+    })
+    result = llm_router.run_cascade(chat, ["small", "big"], [], ROUTING, log=lambda m: None)
+    assert result == ("휴머노이드 공개", "새로운 휴머노이드 로봇이 공개됨.")
+    assert calls == ["small", "big"]
+
+
+def test_all_models_fail():
+    chat, calls = fake_chat({"small": "no korean", "big": "still english"})
+    assert llm_router.run_cascade(chat, ["small", "big"], [], ROUTING, log=lambda m: None) is None
+    assert calls == ["small", "big", "big"]
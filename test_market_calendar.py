@@ -0,0 +1,61 @@
+import asyncio
+import datetime
+from zoneinfo import ZoneInfo
+
+from daily_inform import market, market_calendar
+
+KST = ZoneInfo("Asia/Seoul")
+ET = ZoneInfo("America/New_York")
+
+
+def at(tz, *args):
+    return datetime.datetime(*args, tzinfo=tz)
+
+
+def test_sessions_and_holidays():
+    krx = market_calendar.EXCHANGES["KRX"]
+    nyse = market_calendar.EXCHANGES["NYSE"]
+    assert krx.is_open(at(KST, 2026, 10, 19, 10, 0))
+    assert not krx.is_open(at(KST, 2026, 10, 19, 16, 0))
+    assert not krx.is_open(at(KST, 2026, 10, 9, 10, 0))      # 한글날
+    assert not krx.is_open(at(KST, 2026, 10, 17, 10, 0))     # 토요일
+    assert nyse.is_open(at(ET, 2026, 10, 19, 10, 0))
+    assert not nyse.is_open(at(ET, 2026, 11, 26, 10, 0))     # Thanksgiving
+    assert not nyse.is_open(at(ET, 2026, 11, 27, 13, 30))    # 조기 마감
+    fx = market_calendar.EXCHANGES["FX"]
+    assert fx.is_open(at(ET, 2026, 10, 18, 20, 0))           # 일요일 저녁 개장
+    assert not fx.is_open(at(ET, 2026, 10, 17, 12, 0))       # 토요일
+    assert not fx.is_open(at(ET, 2026, 12, 25, 10, 0))       # 성탄절
+    comex = market_calendar.EXCHANGES["COMEX"]
+    assert not comex.is_open(at(ET, 2026, 12, 25, 10, 0))    # 성탄절
+    assert not comex.is_open(at(ET, 2026, 4, 3, 10, 0))      # Good Friday
+    assert not comex.is_open(at(ET, 2026, 12, 24, 14, 0))    # 성탄 전야 조기 마감
+    assert comex.is_open(at(ET, 2026, 12, 27, 19, 0))        # 일요일 저녁 재개장
+    # 휴장일에는 직전 세션 종가를 이미 받았으면 다시 조회하지 않음
+    assert not market_calendar.needs_refresh("GC=F", at(ET, 2026, 12, 25, 12, 0), at(ET, 2026, 12, 24, 15, 0))
+
+
+def test_needs_refresh_once_after_close():
+    fetched_before_close = at(KST, 2026, 10, 19, 15, 0)
+    after_settle = at(KST, 2026, 10, 19, 16, 0)
+    assert market_calendar.needs_refresh("^KS11", after_settle, fetched_before_close)
+    assert not market_calendar.needs_refresh("^KS11", at(KST, 2026, 10, 19, 17, 0), after_settle)
+    # 주말에는 이미 금요일 종가를 받았으면 조회하지 않음
+    assert not market_calendar.needs_refresh("005930.KS", at(KST, 2026, 10, 17, 12, 0), at(KST, 2026, 10, 16, 18, 0))
+    assert market_calendar.needs_refresh("005930.KS", at(KST, 2026, 10, 17, 12, 0), None)
+
+
+def test_refresh_market_skips_closed_symbols(monkeypatch):
+    calls = []
+    monkeypatch.setattr(market, "get_metric_data", lambda t, c, i=False: calls.append(t) or ("1.00", "+0", "url"))
+    monkeypatch.setattr(market, "get_korea_row", lambda code, name, naver: calls.append(code) or f"<tr>{code}</tr>")
+    state = market.load_dashboard(path="/nonexistent.json")
+
+    saturday = at(KST, 2026, 10, 17, 12, 0)
+    refreshed = asyncio.run(market.refresh_market(state, only_needed=True, now=saturday))
+    assert len(refreshed) == 15                               # 스냅샷이 없으면 전부 조회
+
+    calls.clear()
+    refreshed = asyncio.run(market.refresh_market(state, only_needed=True, now=saturday + datetime.timedelta(hours=1)))
+    assert refreshed == [] and calls == []
+    assert "<tr>005930.KS</tr>" in state["korea_html"]
@@ -0,0 +1,85 @@
+import asyncio
+import random
+import time
+import types
+
+from daily_inform import news
+
+
+class Entry(dict):
+    __getattr__ = dict.get
+
+
+def make_feeds(monkeypatch, feeds, on_link=None):
+    # url → 항목 수 만큼 가짜 RSS 항목을 돌려주는 feedparser
+    class TrackedEntry(Entry):
+        def get(self, key, default=None):
+            if key == 'link' and on_link: on_link()
+            return dict.get(self, key, default)
+
+    def parse(url, agent=None):
+        return types.SimpleNamespace(entries=[
+            TrackedEntry(title=f"{url} {i}", link=f"https://example.com/{url}/{i}", summary="humanoid robot")
+            for i in range(feeds[url])])
+    monkeypatch.setitem(__import__('sys').modules, 'feedparser', types.SimpleNamespace(parse=parse))
+
+
+class FakeTranslator:
+    routing = {"endpoints": ["http://localhost:11434"]}
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+
+    def translate(self, title, snippet, src=None):
+        self.calls += 1
+        if self.delay: time.sleep(random.uniform(0, self.delay))
+        return f"휴머노이드 {title}", "요약"
+
+
+def src(url, cat):
+    return {"url": url, "title": url, "cat": cat}
+
+
+def test_news_fill_cap_before_papers(monkeypatch):
+    make_feeds(monkeypatch, {"n1": 150, "n2": 150, "p1": 20})
+    run = news.NewsRun([], FakeTranslator())
+    config = {"robotics": [src("p1", "paper"), src("n1", "humanoid"), src("n2", "humanoid")]}
+    asyncio.run(news.collect_news(run, config))
+    assert run.new_items_count == news.MAX_NEW_ITEMS
+    assert run.paper_items_count == 0
+    assert not any(item['source'] == "p1" for item in run.archive)
+
+
+def test_papers_limited_and_economy_ordered(monkeypatch):
+    make_feeds(monkeypatch, {"n1": 10, "p1": 20, "e1": 6, "e2": 6})
+    run = news.NewsRun([], FakeTranslator(delay=0.01))
+    config = {"economy": [src("e1", "economy"), src("e2", "economy")],
+              "robotics": [src("p1", "paper"), src("n1", "humanoid")]}
+    economy = asyncio.run(news.collect_news(run, config))
+    assert run.new_items_count == 10 + news.MAX_PAPERS_COUNT
+    assert run.paper_items_count == news.MAX_PAPERS_COUNT
+    # 번역이 끝난 순서와 관계없이 피드 순서 → 항목 순서
+    expected = [f"https://example.com/{u}/{i}" for u in ("e1", "e2") for i in range(news.ECONOMY_PER_FEED)]
+    assert [item['link'] for item in economy] == expected
+
+
+def test_queue_limit_holds_back_producers(monkeypatch):
+    monkeypatch.setattr(news, "QUEUE_SIZE", 2)
+    produced = [0]
+    backlog = []
+    translator = FakeTranslator(delay=0.005)
+    make_feeds(monkeypatch, {"n1": 30, "n2": 30}, on_link=lambda: produced.__setitem__(0, produced[0] + 1))
+    original = translator.translate
+
+    def translate(title, snippet, src=None):
+        backlog.append(produced[0] - translator.calls)
+        return original(title, snippet, src)
+    translator.translate = translate
+
+    run = news.NewsRun([], translator)
+    asyncio.run(news.collect_news(run, {"robotics": [src("n1", "humanoid"), src("n2", "humanoid")]}))
+    assert run.new_items_count == 60
+    # 대기열(2) + worker 가 꺼낸 항목(2) + 피드별로 넣으려고 기다리는 항목(2) 이상 앞서 나가지 않음
+    n_workers = news.LLM_WORKERS_PER_ENDPOINT
+    assert max(backlog) <= 2 + n_workers + 2
@@ -0,0 +1,35 @@
+from daily_inform import prompt_builder
+
+TEMPLATE = """역할 설명
+
+### 입력 데이터 (INPUT DATA)
+- 영어 제목: {title}
+- 영어 내용: {snippet}
+
+### 출력 형식
+제목 ||| 요약
+"""
+
+
+def test_variable_section_moved_to_end():
+    static, variable = prompt_builder.compile_template(TEMPLATE)
+    assert "{title}" not in static and "### 출력 형식" in static
+    assert variable.startswith("### 입력 데이터") and variable.endswith("{snippet}")
+
+
+def test_messages_share_constant_prefix(tmp_path):
+    path = tmp_path / "prompt.md"
+    path.write_text(TEMPLATE, encoding='utf-8')
+    builder = prompt_builder.PromptBuilder(str(path))
+    a = builder.build_messages("Robot A", "First article.")
+    b = builder.build_messages("Robot B", "Second article.")
+    assert a[0] == b[0]
+    assert a[1]['content'].endswith("First article.")
+
+
+def test_snippet_trimmed_to_budget():
+    text = "The humanoid robot walked across the lab. " * 200
+    trimmed = prompt_builder.trim_to_budget(text, 100)
+    assert prompt_builder.estimate_tokens(trimmed) <= 102
+    assert trimmed.endswith("…")
+    assert prompt_builder.trim_to_budget("짧은 문장", 100) == "짧은 문장"
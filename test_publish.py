@@ -0,0 +1,91 @@
+import subprocess
+
+from daily_inform import publish
+
+
+def sh(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def make_clone(tmp_path):
+    # 로컬 bare 저장소를 원격(origin)으로 사용
+    remote = tmp_path / "remote.git"
+    work = tmp_path / "work"
+    sh("init", "-q", "--bare", "-b", "master", str(remote), cwd=tmp_path)
+    sh("clone", "-q", str(remote), str(work), cwd=tmp_path)
+    sh("config", "user.name", "tester", cwd=work)
+    sh("config", "user.email", "tester@example.com", cwd=work)
+    (work / "README.md").write_text("readme")
+    sh("add", "README.md", cwd=work)
+    sh("commit", "-q", "-m", "init", cwd=work)
+    sh("push", "-q", "origin", "HEAD", cwd=work)
+    return remote, work
+
+
+def test_stages_only_changed_artifacts(tmp_path):
+    remote, work = make_clone(tmp_path)
+    (work / "index.html").write_text("v1")
+    (work / "news.html").write_text("news")
+    (work / "update.log").write_text("log")  # 결과물이 아닌 파일은 커밋하지 않음
+
+    assert publish.publish(message="Update", cwd=str(work))
+    assert sh("ls-tree", "--name-only", "master", cwd=remote).split() == ["README.md", "index.html", "news.html"]
+
+    # 내용이 같으면 커밋하지 않음
+    assert not publish.publish(message="Update", cwd=str(work))
+    (work / "index.html").write_text("v2")
+    assert publish.publish(message="Update", cwd=str(work))
+    assert sh("show", "--name-only", "--format=", "master", cwd=remote) == "index.html"
+    assert sh("rev-list", "--count", "master", cwd=remote) == "3"
+
+
+def test_coalesces_only_unpushed_commits(tmp_path):
+    remote, work = make_clone(tmp_path)
+    # push 실패로 로컬에만 남은 배포 커밋
+    (work / "index.html").write_text("v1")
+    assert not publish.publish(message="Hourly", window=3600, remote="missing", cwd=str(work))
+    (work / "index.html").write_text("v2")
+    assert publish.publish(message="Hourly", window=3600, cwd=str(work))
+    assert sh("rev-list", "--count", "master", cwd=remote) == "2"
+    assert sh("show", "master:index.html", cwd=remote) == "v2"
+
+    # 이미 push 된 커밋은 amend 하지 않음
+    (work / "index.html").write_text("v3")
+    assert publish.publish(message="Hourly", window=3600, cwd=str(work))
+    assert sh("rev-list", "--count", "master", cwd=remote) == "3"
+
+
+def test_never_amends_in_shallow_clone(tmp_path):
+    remote, work = make_clone(tmp_path)
+    for version in ("v1", "v2", "v3"):
+        (work / "index.html").write_text(version)
+        publish.publish(message="Hourly", cwd=str(work))
+    shallow = tmp_path / "shallow"
+    sh("clone", "-q", "--depth", "1", f"file://{remote}", str(shallow), cwd=tmp_path)
+    sh("config", "user.name", "tester", cwd=shallow)
+    sh("config", "user.email", "tester@example.com", cwd=shallow)
+    # 로컬에서는 push 전 커밋처럼 보여도 shallow clone 이면 새 커밋으로 (히스토리 유지)
+    sh("update-ref", "-d", "refs/remotes/origin/master", cwd=shallow)
+
+    (shallow / "index.html").write_text("v4")
+    assert publish.publish(message="Hourly", window=10800, cwd=str(shallow))
+    assert sh("rev-list", "--count", "master", cwd=remote) == "5"
+    assert sh("show", "master:index.html", cwd=remote) == "v4"
+
+
+def test_pages_branch_has_squashed_history(tmp_path):
+    remote, work = make_clone(tmp_path)
+    (work / "archive").mkdir()
+    (work / "archive" / "index.json").write_text("{}")
+    (work / "news_archive.json").write_text("[]")
+    for version in ("v1", "v2"):
+        (work / "index.html").write_text(version)
+        publish.publish(message="Update", pages_branch="gh-pages", cwd=str(work))
+
+    assert sh("rev-list", "--count", "gh-pages", cwd=remote) == "1"
+    assert sh("ls-tree", "-r", "--name-only", "gh-pages", cwd=remote).split() == ["archive/index.json", "index.html"]
+    assert sh("show", "gh-pages:index.html", cwd=remote) == "v2"
+    # 작업 브랜치에는 데이터만 커밋됨
+    assert "index.html" not in sh("ls-tree", "-r", "--name-only", "master", cwd=remote).split()
+    # 변경이 없으면 push 생략
+    assert not publish.publish_pages("gh-pages", cwd=str(work))
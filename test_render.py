@@ -0,0 +1,46 @@
+from daily_inform import render
+
+
+def test_template_single_pass():
+    template = render.Template("<p>{{A}}</p><p>{{B}}</p><p>{{MISSING}}</p>")
+    # 값 안에 있는 {{...}} 는 다시 치환되지 않음
+    assert template.render({"A": "{{B}}", "B": 1}) == "<p>{{B}}</p><p>1</p><p>{{MISSING}}</p>"
+    assert template.names == {"A", "B", "MISSING"}
+
+
+def test_render_index_matches_placeholders(tmp_path):
+    out = tmp_path / "index.html"
+    item = {"title": "제목", "link": "https://example.com/1", "summary": "요약", "source": "src", "date": "2026-08-01 10:00"}
+    render.render_index({"KOSPI": ("2,500.00", "<span>+1</span>", "chart-url")}, "<table></table>",
+                        [item], [item], [], out_path=str(out), now_str="NOW")
+    html = out.read_text(encoding='utf-8')
+    assert "Updated: NOW" in html and "2,500.00" in html and "chart-url" in html
+    assert "{{KOSPI_VAL}}" not in html and "{{NEWS_CONTENT}}" not in html
+    assert "📈 증시/경제" in html and "🦾 핸드/그리퍼" not in html
+    # 값이 없는 지표는 기존처럼 그대로 남음
+    assert "{{KOSDAQ_VAL}}" in html
+
+
+def test_card_list():
+    items = [{"title": "t", "link": "l", "source": "s", "date": "2026-08-01 10:00", "original_title": "it's"}, {"link": "x"}]
+    html = render.generate_card_list(items)
+    assert html.count("class='news-card'") == 1
+    assert "it&#39;s" in html and "news-summary" not in html
+
+
+def test_simple_list_title_only_items():
+    html = render.generate_simple_list([{"title": "제목", "link": "https://example.com/1"}])
+    assert html == "<li class='news-item'><a href='https://example.com/1' target='_blank'>제목</a></li>"
+
+
+def test_render_all_keeps_index_without_snapshot(tmp_path, monkeypatch):
+    from daily_inform import pipeline
+    for name in ("template.html", "news_template.html"):
+        (tmp_path / name).write_text(open(name, encoding='utf-8').read(), encoding='utf-8')
+    (tmp_path / "index.html").write_text("published", encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+
+    # dashboard_state.json 이 없는 새 checkout: news.html 만 생성하고 index.html 은 유지
+    pipeline.render_all(now_str="NOW")
+    assert (tmp_path / "index.html").read_text(encoding='utf-8') == "published"
+    assert "Updated: NOW" in (tmp_path / "news.html").read_text(encoding='utf-8')
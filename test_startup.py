@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["yfinance", "pandas", "numpy", "feedparser", "ollama", "deep_translator"]
+
+
+def test_cli_import_is_lightweight():
+    # CLI 와 market/render 경로는 무거운 라이브러리를 import 시점에 읽지 않아야 함
+    code = ("import sys, daily_inform.cli, daily_inform.pipeline, daily_inform.legacy; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
+
+
+def test_cli_help_runs():
+    # 실행 시간은 환경마다 달라 검사하지 않음 (무거운 import 여부는 위 테스트에서 확인)
+    out = subprocess.run([sys.executable, "-m", "daily_inform", "--help"], capture_output=True, text=True, check=True)
+    assert "legacy" in out.stdout and "publish" in out.stdout
@@ -0,0 +1,69 @@
+import datetime
+
+from daily_inform import render, trends
+from daily_inform.news import item_keywords
+
+TODAY = datetime.date(2026, 10, 19)
+
+
+def make_item(day, source, title, category="humanoid"):
+    return {"title": title, "original_title": title, "summary": "", "date": f"{day} 09:00",
+            "category": category, "source": source, "link": f"https://example.com/{source}/{day}/{title}"}
+
+
+def test_rolling_top_n(tmp_path):
+    counter = trends.TrendCounter()
+    items = [
+        make_item("2026-10-18", "A", "Tesla Optimus humanoid update"),
+        make_item("2026-10-17", "A", "Figure humanoid robot"),
+        make_item("2026-10-16", "B", "Optimus demo"),
+        make_item("2026-10-01", "B", "Unitree humanoid"),
+        make_item("2026-10-18", "C", "New robot gripper", category="hand"),
+    ]
+    for item in items:
+        counter.add(item, item_keywords(item), TODAY)
+
+    assert counter.top_keywords(7, 1, "humanoid", TODAY) == [("humanoid", 2)]
+    assert dict(counter.top_keywords(30, 10, "humanoid", TODAY))["humanoid"] == 3
+    assert counter.top_sources(7, 5, today=TODAY) == [("A", 2), ("B", 1), ("C", 1)]
+    assert counter.top_sources(30, 5, today=TODAY)[:2] == [("A", 2), ("B", 2)]
+
+    # 저장/로드 후에도 같은 결과
+    path = str(tmp_path / "trends.json")
+    trends.save_trends(counter, path)
+    assert trends.load_trends(path).top_sources(30, 5, today=TODAY) == counter.top_sources(30, 5, today=TODAY)
+    assert trends.load_trends(str(tmp_path / "missing.json")) is None
+
+
+def test_old_days_age_out():
+    counter = trends.TrendCounter()
+    counter.add(make_item("2026-09-01", "A", "Optimus"), ["optimus"], TODAY)
+    assert counter.days == {}  # 보관 기간 밖의 기사는 집계하지 않음
+
+    counter.add(make_item("2026-09-25", "A", "Optimus"), ["optimus"], TODAY)
+    counter.add(make_item("2026-10-19", "B", "Optimus"), ["optimus"], TODAY)
+    counter.expire(TODAY + datetime.timedelta(days=10))
+    assert list(counter.days) == ["2026-10-19"]
+    assert counter.top_keywords(30, 5, "humanoid", TODAY) == [("optimus", 1)]
+
+
+def test_rebuild_and_render():
+    archive = [make_item("2026-10-18", "A", "Optimus humanoid"), {"link": "https://example.com/old"}]
+    counter = trends.rebuild(archive, item_keywords, TODAY)
+    assert counter.top_sources(7, 5, today=TODAY) == [("A", 1)]
+    assert render.trends_html(None) == ""
+    assert "humanoid <b>1</b>" in render.trends_html(counter, today=TODAY)
+
+
+def test_legacy_run_counts_new_items(monkeypatch):
+    import sys
+    import types
+    from daily_inform import legacy
+    entry = types.SimpleNamespace(title="New humanoid robot", link="https://example.com/legacy/1", get=lambda k, d=None: d)
+    monkeypatch.setitem(sys.modules, 'feedparser', types.SimpleNamespace(parse=lambda url, agent=None: types.SimpleNamespace(entries=[entry])))
+    monkeypatch.setattr(legacy, "translate_text", lambda text: text)
+    monkeypatch.setattr(legacy.time, "sleep", lambda s: None)
+
+    archive, counter = [], trends.TrendCounter()
+    assert legacy.collect_robotics(archive, counter) == 1
+    assert counter.top_sources(7, 5) == [(archive[0]['source'], 1)]